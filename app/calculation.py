@@ -1,10 +1,24 @@
 from __future__ import annotations
-from dataclasses import dataclass, asdict
-from datetime import datetime, timezone  # compatible across Python 3.10–3.13
-from typing import Dict, Any
+from dataclasses import dataclass
+import time
+from typing import Dict, Any, Tuple
 
+# Last formatted UTC second -> "YYYY-MM-DDTHH:MM:SS" prefix (reused within the same second)
+_TS_CACHE: Dict[str, Any] = {"sec": -1, "prefix": ""}
 
-@dataclass
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time in ``datetime.isoformat()`` layout."""
+    t = time.time()
+    s = int(t)
+    us = int((t - s) * 1_000_000)
+    if s != _TS_CACHE["sec"]:
+        _TS_CACHE["prefix"] = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(s))
+        _TS_CACHE["sec"] = s
+    return f"{_TS_CACHE['prefix']}.{us:06d}+00:00"
+
+
+@dataclass(slots=True, frozen=True)
 class Calculation:
     """Represents a single calculator operation and its result."""
     operation: str
@@ -21,9 +35,19 @@ class Calculation:
             a=a,
             b=b,
             result=result,
-            timestamp=datetime.now(timezone.utc).isoformat()  # universal UTC timestamp
+            timestamp=_utc_timestamp()  # universal UTC timestamp
         )
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert this Calculation to a serializable dictionary."""
-        return asdict(self)
\ No newline at end of file
+        return {
+            "operation": self.operation,
+            "a": self.a,
+            "b": self.b,
+            "result": self.result,
+            "timestamp": self.timestamp,
+        }
+
+    def to_row(self) -> Tuple[str, float, float, float, str]:
+        """Return the CSV row for this Calculation (operation, a, b, result, timestamp)."""
+        return (self.operation, self.a, self.b, self.result, self.timestamp)
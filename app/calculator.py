@@ -1,16 +1,17 @@
 from __future__ import annotations
-from typing import List, Dict
+import math
+import sys
+from typing import Any, List, Dict
 from colorama import init as color_init, Fore
-import difflib
 
 from .operations import OperationFactory
 from .input_validators import parse_two_numbers
 from .calculation import Calculation
 from .exceptions import CalculatorError, OperationError, ValidationError, HistoryError
 from .calculator_config import load_config
-from .calculator_memento import Caretaker
-from .history import History, LoggingObserver, AutoSaveObserver
-from .command_registry import command, resolve as resolve_cmd, all_specs, aliases_for
+from .calculator_memento import Caretaker, DeltaMemento
+from .history import History, LoggingObserver, AutoSaveObserver, Observer
+from .command_registry import command, resolve as resolve_cmd, all_specs, aliases_for, registry_version
 
 
 # Operation-only aliases (kept for REPL)
@@ -24,36 +25,52 @@ OP_ALIASES: Dict[str, str] = {
     "^": "power",
 }
 
+# Every accepted operation token (canonical name or alias) -> canonical name
+_OP_NAMES: Dict[str, str] = {**{name: name for name in OperationFactory.mapping}, **OP_ALIASES}
+
 
 class Calculator:
     def __init__(self) -> None:
         cfg = load_config()
         self.cfg = cfg
         self.history = History(cfg.max_history_size)
-        self.caretaker = Caretaker()
+        self.caretaker = Caretaker(cfg.max_undo_depth)
 
         # runtime precision (mutable)
         self.precision = cfg.precision
+        self._pow10 = 10 ** cfg.precision
 
         # observers for logging/autosave
         self.log_observer = LoggingObserver()
         self.auto_observer = AutoSaveObserver()
         self.observers = [self.log_observer, self.auto_observer]
+        # bound update methods, resolved once instead of per notification
+        self._observer_updates = [ob.update for ob in self.observers]
+
+    def add_observer(self, observer: Observer) -> None:
+        self.observers.append(observer)
+        self._observer_updates.append(observer.update)
 
     def _notify(self, calc: Calculation) -> None:
-        for ob in self.observers:
-            ob.update(calc, self.history)
+        for upd in self._observer_updates:
+            upd(calc, self.history)
 
     def calculate(self, op_name: str, a: float, b: float) -> float:
-        # Save snapshot before mutation (undo support)
-        self.caretaker.save(self.history.to_snapshot())
-
-        op = OperationFactory.create(op_name)
-        result = op.execute(a, b)
-        result = round(result, self.precision)
+        result = OperationFactory.create(op_name)(a, b)
+        # Scale, round half-to-even to an integer, scale back. This can differ from
+        # round(result, precision) in the last digit for values whose decimal form
+        # sits exactly on a rounding boundary; ints and non-finite/overflowing
+        # values keep round().
+        scaled = result * self._pow10 if isinstance(result, float) else math.inf
+        if math.isfinite(scaled):
+            result = round(scaled) / self._pow10
+        else:
+            result = round(result, self.precision)
 
         calc = Calculation.from_values(op_name, a, b, result)
-        self.history.add(calc)
+        evicted = self.history.add(calc)
+        # Record only the inverse change (undo support), not a full snapshot
+        self.caretaker.save(DeltaMemento("pop_last", evicted))
         self._notify(calc)
         return result
 
@@ -68,22 +85,20 @@ class Calculator:
 
     # --- History operations ---
     def cmd_clear(self) -> None:
-        self.caretaker.save(self.history.to_snapshot())
+        self.caretaker.save(DeltaMemento("restore", self.history.to_snapshot()))
         self.history.clear()
 
     def cmd_undo(self) -> None:
-        snap = self.caretaker.undo(self.history.to_snapshot())
-        self.history.restore(snap)
+        self.caretaker.undo_with(self.history.apply)
 
     def cmd_redo(self) -> None:
-        snap = self.caretaker.redo(self.history.to_snapshot())
-        self.history.restore(snap)
+        self.caretaker.redo_with(self.history.apply)
 
     def cmd_save(self) -> str:
         return self.history.save_csv()
 
     def cmd_load(self) -> int:
-        self.caretaker.save(self.history.to_snapshot())
+        self.caretaker.save(DeltaMemento("restore", self.history.to_snapshot()))
         return self.history.load_csv()
 
     def cmd_get_precision(self) -> int:
@@ -93,16 +108,15 @@ class Calculator:
         if n < 0 or n > 18:
             raise ValidationError("Precision must be between 0 and 18.")
         self.precision = n
+        self._pow10 = 10 ** n
         return self.precision
 
 
 # ---------------- Helper functions ---------------- #
 
 def _suggest(cmd: str) -> str | None:
-    candidates = set([spec.name for spec in all_specs()])
-    candidates |= set(OP_ALIASES.keys())
-    candidates |= set(OperationFactory.mapping.keys())
-    matches = difflib.get_close_matches(cmd, sorted(candidates), n=1, cutoff=0.6)
+    import difflib  # only needed on typos; keeps it off the startup path
+    matches = difflib.get_close_matches(cmd, _suggest_candidates(), n=1, cutoff=0.6)
     return matches[0] if matches else None
 
 
@@ -197,8 +211,27 @@ def _cmd_exit(calc: Calculator, args: List[str]) -> None:
     raise SystemExit
 
 
+# Typo-suggestion candidates, rebuilt only when a command has been registered since
+_SUGGEST_CACHE: Dict[str, Any] = {"version": -1, "names": ()}
+
+
+def _suggest_candidates() -> tuple:
+    version = registry_version()
+    if version != _SUGGEST_CACHE["version"]:
+        _SUGGEST_CACHE["names"] = tuple(sorted(
+            {spec.name for spec in all_specs()} | set(OP_ALIASES) | set(OperationFactory.mapping)
+        ))
+        _SUGGEST_CACHE["version"] = version
+    return _SUGGEST_CACHE["names"]
+
+
 # ------------------------- REPL entrypoint ------------------------- #
 
+# Per-line output prefixes, concatenated once instead of on every line
+_PROMPT = Fore.WHITE + "> "
+_RESULT = Fore.GREEN + "Result: "
+_ERR = Fore.RED + "Error: "
+
 def main() -> None:
     color_init(autoreset=True)
     calc = Calculator()
@@ -206,36 +239,36 @@ def main() -> None:
 
     while True:
         try:
-            line = input(Fore.WHITE + "> ").strip()
+            line = input(_PROMPT).strip()
             if not line:
                 continue
-            parts = line.split()
-            cmd_raw, args = parts[0], parts[1:]
+            cmd_raw, *args = line.split()
+            cmd = cmd_raw.lower()
 
             # 1) Decorator-registered commands first
-            spec = resolve_cmd(cmd_raw.lower())
+            spec = resolve_cmd(cmd)
             if spec is not None:
                 spec.handler(calc, args)
                 continue
 
             # 2) Otherwise treat as arithmetic operation
-            op = OP_ALIASES.get(cmd_raw.lower(), cmd_raw.lower())
-            if op not in OperationFactory.mapping:
+            op = _OP_NAMES.get(cmd)
+            if op is None:
                 raise OperationError(f"Unknown operation: {cmd_raw}")
 
-            a, b = parse_two_numbers(args)
+            a, b = parse_two_numbers(args, calc.cfg.max_input_value)
             result = calc.calculate(op, a, b)
-            print(Fore.GREEN + f"Result: {result}")
+            sys.stdout.write(f"{_RESULT}{result}\n")
 
         except (OperationError, ValidationError, HistoryError) as e:
             if isinstance(e, OperationError) and "Unknown operation" in str(e):
-                suggestion = _suggest(cmd_raw.lower())
+                suggestion = _suggest(cmd)
                 msg = f"{e}"
                 if suggestion:
                     msg += f" (did you mean '{suggestion}'?)"
-                print(Fore.RED + f"Error: {msg}")
+                sys.stdout.write(f"{_ERR}{msg}\n")
             else:
-                print(Fore.RED + f"Error: {e}")
+                sys.stdout.write(f"{_ERR}{e}\n")
         except SystemExit:
             break
         except KeyboardInterrupt:
@@ -1,13 +1,15 @@
 from __future__ import annotations
 import os
 from dataclasses import dataclass
-from dotenv import load_dotenv
+from functools import lru_cache
+from typing import Tuple
 
 @dataclass(frozen=True)
 class Config:
     log_dir: str
     history_dir: str
     max_history_size: int
+    max_undo_depth: int
     auto_save: bool
     precision: int
     max_input_value: float
@@ -15,15 +17,34 @@ class Config:
     log_file: str
     history_file: str
 
-def load_config() -> Config:
+# (env var, default) pairs; their current values form the config cache key
+_ENV_SETTINGS: Tuple[Tuple[str, str], ...] = (
+    ("CALCULATOR_LOG_DIR", ".logs"),
+    ("CALCULATOR_HISTORY_DIR", ".history"),
+    ("CALCULATOR_MAX_HISTORY_SIZE", "1000"),
+    ("CALCULATOR_MAX_UNDO_DEPTH", "50"),
+    ("CALCULATOR_AUTO_SAVE", "true"),
+    ("CALCULATOR_PRECISION", "6"),
+    ("CALCULATOR_MAX_INPUT_VALUE", "1e12"),
+    ("CALCULATOR_DEFAULT_ENCODING", "utf-8"),
+)
+
+@lru_cache(maxsize=1)
+def _load_dotenv() -> None:
+    """Read .env into the environment once per process (existing vars win)."""
+    try:
+        from dotenv import load_dotenv
+    except ImportError:  # pragma: no cover - python-dotenv is optional
+        return
     load_dotenv()
-    log_dir = os.getenv("CALCULATOR_LOG_DIR", ".logs")
-    history_dir = os.getenv("CALCULATOR_HISTORY_DIR", ".history")
-    max_history_size = int(os.getenv("CALCULATOR_MAX_HISTORY_SIZE", "1000"))
-    auto_save = os.getenv("CALCULATOR_AUTO_SAVE", "true").lower() in {"1", "true", "yes", "y"}
-    precision = int(os.getenv("CALCULATOR_PRECISION", "6"))
-    max_input_value = float(os.getenv("CALCULATOR_MAX_INPUT_VALUE", "1e12"))
-    default_encoding = os.getenv("CALCULATOR_DEFAULT_ENCODING", "utf-8")
+
+@lru_cache(maxsize=32)
+def _build_config(values: Tuple[str, ...]) -> Config:
+    (log_dir, history_dir, max_history_size, max_undo_depth,
+     auto_save, precision, max_input_value, default_encoding) = values
+
+    if int(max_history_size) < 0:
+        raise ValueError("CALCULATOR_MAX_HISTORY_SIZE must be a non-negative integer.")
 
     os.makedirs(log_dir, exist_ok=True)
     os.makedirs(history_dir, exist_ok=True)
@@ -34,11 +55,20 @@ def load_config() -> Config:
     return Config(
         log_dir=log_dir,
         history_dir=history_dir,
-        max_history_size=max_history_size,
-        auto_save=auto_save,
-        precision=precision,
-        max_input_value=max_input_value,
+        max_history_size=int(max_history_size),
+        max_undo_depth=int(max_undo_depth),
+        auto_save=auto_save.lower() in {"1", "true", "yes", "y"},
+        precision=int(precision),
+        max_input_value=float(max_input_value),
         default_encoding=default_encoding,
         log_file=log_file,
         history_file=history_file,
-    )
\ No newline at end of file
+    )
+
+def load_config() -> Config:
+    """
+    Return the Config for the current environment. Configs are shared per
+    distinct set of CALCULATOR_* values, so repeated calls only re-read the env.
+    """
+    _load_dotenv()
+    return _build_config(tuple(os.getenv(name, default) for name, default in _ENV_SETTINGS))
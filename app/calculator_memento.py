@@ -1,44 +1,74 @@
 from __future__ import annotations
+from collections import deque
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Any, Callable, Deque, Tuple, Union
 from .calculation import Calculation
 
 @dataclass(frozen=True)
 class HistorySnapshot:
     state: Tuple[Calculation, ...]
 
+@dataclass(frozen=True)
+class DeltaMemento:
+    """A single reversible history change.
+
+    kind is one of "pop_last" (payload: evicted Calculation or None),
+    "append" (payload: Calculation) or "restore" (payload: HistorySnapshot).
+    """
+    kind: str
+    payload: Any
+
+Memento = Union[HistorySnapshot, DeltaMemento]
+
 class Caretaker:
-    def __init__(self) -> None:
-        self._undo: List[HistorySnapshot] = []
-        self._redo: List[HistorySnapshot] = []
+    def __init__(self, max_depth: int = 50) -> None:
+        # bounded: the oldest entries are evicted once max_depth is reached
+        self._undo: Deque[Memento] = deque(maxlen=max_depth)
+        self._redo: Deque[Memento] = deque(maxlen=max_depth)
 
-    def save(self, snapshot: HistorySnapshot) -> None:
+    def save(self, snapshot: Memento) -> None:
         """Save a snapshot for potential undo and clear redo since we branched."""
         self._undo.append(snapshot)
         self._redo.clear()
 
     def can_undo(self) -> bool:
-        return len(self._undo) > 0
+        return bool(self._undo)
 
     def can_redo(self) -> bool:
-        return len(self._redo) > 0
+        return bool(self._redo)
+
+    def undo(self, current: Memento) -> Memento:
+        """Return the previous snapshot and push current to redo.
 
-    def undo(self, current: HistorySnapshot) -> HistorySnapshot:
-        """Return the previous snapshot and push current to redo."""
+        Only meaningful on a Caretaker that stores HistorySnapshots; one fed
+        DeltaMementos (as Calculator does) must use undo_with instead.
+        """
         if not self._undo:
             raise IndexError("Nothing to undo")
         prev = self._undo.pop()
         self._redo.append(current)
         return prev
 
-    def redo(self, current: HistorySnapshot) -> HistorySnapshot:
-        """Return the next snapshot and push current back to undo."""
+    def redo(self, current: Memento) -> Memento:
+        """Return the next snapshot and push current back to undo (snapshot-only, see undo)."""
         if not self._redo:
             raise IndexError("Nothing to redo")
         nxt = self._redo.pop()
         self._undo.append(current)
         return nxt
 
+    def undo_with(self, apply: Callable[[DeltaMemento], DeltaMemento]) -> None:
+        """Apply the last delta and push the inverse it returns to redo."""
+        if not self._undo:
+            raise IndexError("Nothing to undo")
+        self._redo.append(apply(self._undo.pop()))
+
+    def redo_with(self, apply: Callable[[DeltaMemento], DeltaMemento]) -> None:
+        """Re-apply the last undone delta and push its inverse back to undo."""
+        if not self._redo:
+            raise IndexError("Nothing to redo")
+        self._undo.append(apply(self._redo.pop()))
+
     def clear(self) -> None:
         self._undo.clear()
-        self._redo.clear()
\ No newline at end of file
+        self._redo.clear()
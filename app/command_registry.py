@@ -1,20 +1,22 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 # NOTE: We avoid importing Calculator to prevent circular imports.
 # Handlers receive (calc, args) where calc is your Calculator instance.
 Handler = Callable[[object, List[str]], None]
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CommandSpec:
     name: str
     handler: Handler
     help: str
-    aliases: List[str]
+    aliases: Tuple[str, ...]
 
+# Keyed by canonical name *and* every alias, so resolve() is a single lookup
 _registry: Dict[str, CommandSpec] = {}
-_alias_to_name: Dict[str, str] = {}
+# Bumped on every registration so callers can cache views of the registry
+_version = 0
 
 def command(name: str, help: str, aliases: Optional[List[str]] = None):
     """
@@ -25,20 +27,25 @@ def command(name: str, help: str, aliases: Optional[List[str]] = None):
             print(" ".join(args))
     """
     def decorator(func: Handler) -> Handler:
-        spec = CommandSpec(name=name, handler=func, help=help, aliases=list(aliases or []))
+        global _version
+        spec = CommandSpec(name=name, handler=func, help=help, aliases=tuple(aliases or ()))
         _registry[name] = spec
         for al in spec.aliases:
-            _alias_to_name[al] = name
+            _registry[al] = spec
+        _version += 1
         return func
     return decorator
 
 def resolve(name: str) -> Optional[CommandSpec]:
-    canonical = _alias_to_name.get(name, name)
-    return _registry.get(canonical)
+    return _registry.get(name)
 
 def all_specs() -> List[CommandSpec]:
-    # Return a stable order: alphabetical by name
-    return sorted(_registry.values(), key=lambda s: s.name)
+    # One entry per command (skip alias keys), in a stable order: alphabetical by name
+    return sorted((s for key, s in _registry.items() if key == s.name), key=lambda s: s.name)
+
+def registry_version() -> int:
+    """Return a counter that changes whenever a command is registered."""
+    return _version
 
 def aliases_for(name: str) -> List[str]:
     spec = _registry.get(name)
@@ -1,16 +1,28 @@
 from __future__ import annotations
-from typing import List, Protocol
+from collections import deque
+from typing import TYPE_CHECKING, Deque, Iterable, List, Optional, Protocol, Sequence, Tuple
+import csv
+import logging
 import os
 import shutil
 import tempfile
-import pandas as pd
-from pandas.errors import EmptyDataError  # NEW
 
 from .calculation import Calculation
 from .calculator_config import load_config
 from .exceptions import HistoryError
 from .logger import get_logger
 
+if TYPE_CHECKING:  # pragma: no cover
+    import pandas as pd
+
+COLUMNS = ("operation", "a", "b", "result", "timestamp")
+_IO_BUFFER_SIZE = 1 << 20
+
+
+def _to_float(field: str) -> float:
+    # Empty numeric fields mean NaN, as pandas.read_csv / DataFrame.to_csv treat them
+    return float(field) if field else float("nan")
+
 
 class Observer(Protocol):  # pragma: no cover — exercised via concrete observers
     def update(self, calc: Calculation, history: "History") -> None: ...
@@ -18,107 +30,208 @@ class Observer(Protocol):  # pragma: no cover — exercised via concrete observe
 
 class History:
     def __init__(self, max_size: int) -> None:
-        self._items: List[Calculation] = []
+        # bounded: appending past max_size evicts the oldest entry in O(1)
+        self._items: Deque[Calculation] = deque(maxlen=max_size)
         self._max = max_size
+        # tuple of the current items, shared by snapshots until the next mutation
+        self._snapshot_cache: Optional[Tuple[Calculation, ...]] = None
+        # history file last written/read and how many items it mirrors (None = out of sync)
+        self._saved_path: Optional[str] = None
+        self._saved_len: Optional[int] = None
+        self._cfg = load_config()
+
+    def refresh_config(self) -> None:
+        """Re-read settings (history file, encoding) after the environment changed."""
+        self._cfg = load_config()
 
     def items(self) -> List[Calculation]:
         return list(self._items)
 
+    def __len__(self) -> int:
+        return len(self._items)
+
     def clear(self) -> None:
         self._items.clear()
+        self._snapshot_cache = None
+        self._saved_len = None
 
-    def add(self, calc: Calculation) -> None:
+    def add(self, calc: Calculation) -> Optional[Calculation]:
+        """Append calc and return the entry evicted to stay within capacity, if any."""
+        evicted = self._items[0] if self._items and len(self._items) == self._max else None
         self._items.append(calc)
-        if len(self._items) > self._max:
-            # drop oldest when exceeding capacity
-            self._items.pop(0)
+        self._snapshot_cache = None
+        if evicted is not None:
+            self._saved_len = None
+        return evicted
 
     def to_snapshot(self):
         from .calculator_memento import HistorySnapshot
-        return HistorySnapshot(tuple(self._items))
+        if self._snapshot_cache is None:
+            self._snapshot_cache = tuple(self._items)
+        return HistorySnapshot(self._snapshot_cache)
 
     def restore(self, snapshot) -> None:
-        self._items = list(snapshot.state)
+        self._items = deque(snapshot.state, maxlen=self._max)
+        self._snapshot_cache = snapshot.state
+        self._saved_len = None
+
+    def apply(self, delta):
+        """Apply an undo/redo delta and return the delta that reverses it."""
+        from .calculator_memento import DeltaMemento
+        if delta.kind == "pop_last":
+            if not self._items:
+                # entry was never stored (max_size == 0): nothing to undo, nothing to redo
+                return DeltaMemento("pop_last", None)
+            calc = self._items.pop()
+            self._snapshot_cache = None
+            self._saved_len = None
+            if delta.payload is not None:
+                self._items.appendleft(delta.payload)
+            return DeltaMemento("append", calc)
+        if delta.kind == "append":
+            return DeltaMemento("pop_last", self.add(delta.payload))
+        if delta.kind == "restore":
+            current = self.to_snapshot()
+            self.restore(delta.payload)
+            return DeltaMemento("restore", current)
+        raise HistoryError(f"Unknown history change: {delta.kind}")
 
     # --------- Persistence ----------
     def to_dataframe(self) -> pd.DataFrame:
-        data = [c.to_dict() for c in self._items]
-        return pd.DataFrame(data, columns=["operation", "a", "b", "result", "timestamp"])
+        import pandas as pd  # only needed for DataFrame export
+        if not self._items:
+            return pd.DataFrame(columns=list(COLUMNS))
+        # one pass over the entries, transposed into columns
+        columns = (list(col) for col in zip(*map(Calculation.to_row, self._items)))
+        return pd.DataFrame(dict(zip(COLUMNS, columns)))
 
-    def _atomic_write(self, path: str, df: pd.DataFrame, encoding: str) -> None:
+    def _atomic_write(self, path: str, rows: Iterable[Sequence[object]], encoding: str) -> None:
         """Write CSV atomically to avoid partial/corrupt files."""
         directory = os.path.dirname(path) or "."
         os.makedirs(directory, exist_ok=True)
-        with tempfile.NamedTemporaryFile("w", delete=False, dir=directory, suffix=".tmp", encoding=encoding) as tmp:
+        with tempfile.NamedTemporaryFile(
+            "w", delete=False, dir=directory, suffix=".tmp",
+            encoding=encoding, newline="", buffering=_IO_BUFFER_SIZE,
+        ) as tmp:
             tmp_path = tmp.name
-            df.to_csv(tmp_path, index=False, encoding=encoding)
+            writer = csv.writer(tmp, lineterminator="\n")
+            writer.writerow(COLUMNS)
+            writer.writerows(rows)
         shutil.move(tmp_path, path)
 
     def save_csv(self) -> str:
-        cfg = load_config()
+        cfg = self._cfg
+        if self._is_saved(cfg.history_file):
+            return cfg.history_file  # file already mirrors the history; skip the rewrite
         try:
-            df = self.to_dataframe()
-            self._atomic_write(cfg.history_file, df, cfg.default_encoding)
-            return cfg.history_file
-        except Exception as e:  # pragma: no cover (pandas/internal IO)
+            rows = map(Calculation.to_row, self._items)
+            self._atomic_write(cfg.history_file, rows, cfg.default_encoding)
+        except Exception as e:  # pragma: no cover (internal IO)
             raise HistoryError(f"Failed to save history: {e}") from e
+        self._saved_path, self._saved_len = cfg.history_file, len(self._items)
+        return cfg.history_file
+
+    def _is_saved(self, path: str) -> bool:
+        """True when path is known to hold exactly the current items."""
+        return (
+            self._saved_path == path
+            and self._saved_len == len(self._items)
+            and os.path.exists(path)
+        )
 
-    def _read_with_fallback(self, path: str, primary_encoding: str) -> pd.DataFrame:
+    def append_csv_row(self, calc: Calculation) -> str:
+        """
+        Persist the most recent add(). Appends a single row when the file already
+        mirrors every earlier item; otherwise (first save, eviction, undo, clear,
+        another file) falls back to a full save_csv().
+        """
+        cfg = self._cfg
+        path = cfg.history_file
+        in_sync = (
+            self._saved_path == path
+            and self._saved_len is not None
+            and self._saved_len == len(self._items) - 1
+            and self._items[-1] is calc
+            and os.path.exists(path)
+        )
+        if not in_sync:
+            return self.save_csv()
+        try:
+            with open(path, "a", newline="", encoding=cfg.default_encoding) as f:
+                csv.writer(f, lineterminator="\n").writerow(calc.to_row())
+        except Exception as e:  # pragma: no cover (internal IO)
+            raise HistoryError(f"Failed to save history: {e}") from e
+        self._saved_len += 1
+        return path
+
+    def _read_with_fallback(self, path: str, primary_encoding: str) -> Tuple[List[Calculation], bool]:
         # Try configured encoding first, then UTF-8 with BOM as a fallback
         try:
-            return pd.read_csv(path, encoding=primary_encoding)
-        except EmptyDataError:
-            # Map empty CSV to a clear HistoryError
-            raise HistoryError("History file is empty.")
+            return self._read_rows(path, primary_encoding)
         except UnicodeError:
-            # Fallback for BOM or weird editors
-            try:
-                return pd.read_csv(path, encoding="utf-8-sig")
-            except EmptyDataError:
-                raise HistoryError("History file is empty.")
+            # Fallback for BOM or weird editors; never appended to as-is
+            items, _ = self._read_rows(path, "utf-8-sig")
+            return items, False
 
-    def _validate_loaded_df(self, df: pd.DataFrame) -> None:
-        required = {"operation", "a", "b", "result", "timestamp"}
-        if df.empty:
+    def _read_rows(self, path: str, encoding: str) -> Tuple[List[Calculation], bool]:
+        """Return the parsed entries and whether the header is exactly COLUMNS."""
+        with open(path, newline="", encoding=encoding, buffering=_IO_BUFFER_SIZE) as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if not header:
+                raise HistoryError("History file is empty.")
+            exact_header = tuple(header) == COLUMNS
+            header[0] = header[0].lstrip("\ufeff")
+            missing = set(COLUMNS) - set(header)
+            if missing:
+                raise HistoryError(f"Malformed history file: missing columns {sorted(missing)}.")
+            op_i, a_i, b_i, r_i, ts_i = (header.index(col) for col in COLUMNS)
+            try:
+                items = [
+                    Calculation(row[op_i], _to_float(row[a_i]), _to_float(row[b_i]), _to_float(row[r_i]), row[ts_i])
+                    for row in reader
+                    if row
+                ]
+            except IndexError as e:
+                raise HistoryError("Malformed history file: row is missing fields.") from e
+        if not items:
             raise HistoryError("History file is empty.")
-        if not required.issubset(df.columns):
-            missing = required - set(df.columns)
-            raise HistoryError(f"Malformed history file: missing columns {sorted(missing)}.")
+        return items, exact_header
+
+    @staticmethod
+    def _ends_with_newline(path: str) -> bool:
+        with open(path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
 
     def load_csv(self) -> int:
-        cfg = load_config()
+        cfg = self._cfg
         path = cfg.history_file
         if not os.path.exists(path):
             raise HistoryError("History file not found.")
 
         try:
-            df = self._read_with_fallback(path, cfg.default_encoding)
-            self._validate_loaded_df(df)
-            df = df.astype({
-                "operation": "string",
-                "a": "float64",
-                "b": "float64",
-                "result": "float64",
-                "timestamp": "string",
-            }, errors="raise")
+            items, exact_header = self._read_with_fallback(path, cfg.default_encoding)
         except HistoryError:
             raise
         except ValueError as e:
-            # pandas dtype conversion error
+            # float() conversion error
             raise HistoryError(f"Malformed history file: invalid data types ({e}).") from e
         except Exception as e:  # pragma: no cover
             raise HistoryError(f"Failed to load history: {e}") from e
 
-        self._items = [
-            Calculation(
-                operation=str(row["operation"]),
-                a=float(row["a"]),
-                b=float(row["b"]),
-                result=float(row["result"]),
-                timestamp=str(row["timestamp"]),
-            )
-            for _, row in df.iterrows()
-        ]
+        self._items = deque(items, maxlen=self._max)
+        self._snapshot_cache = None
+        # Appending later rows is only safe if the file has our exact layout
+        # (header, no BOM, trailing newline) and nothing was dropped to fit
+        # max_size; otherwise the first autosave does a full rewrite.
+        self._saved_path = path
+        in_sync = (
+            exact_header
+            and len(items) == len(self._items)
+            and self._ends_with_newline(path)
+        )
+        self._saved_len = len(items) if in_sync else None
         return len(self._items)
 
 
@@ -128,10 +241,11 @@ class LoggingObserver:
         self._log = get_logger()
 
     def update(self, calc: Calculation, history: History) -> None:
-        self._log.info(
-            "calc=%s a=%s b=%s result=%s ts=%s size=%s",
-            calc.operation, calc.a, calc.b, calc.result, calc.timestamp, len(history.items())
-        )
+        if self._log.isEnabledFor(logging.INFO):
+            self._log.info(
+                "calc=%s a=%s b=%s result=%s ts=%s size=%s",
+                calc.operation, calc.a, calc.b, calc.result, calc.timestamp, len(history)
+            )
 
 
 class AutoSaveObserver:
@@ -139,8 +253,8 @@ class AutoSaveObserver:
         self._enabled = load_config().auto_save
 
     def update(self, calc: Calculation, history: History) -> None:
-        if self._enabled:
-            history.save_csv()
+        if self._enabled and len(history):
+            history.append_csv_row(calc)
 
     # runtime toggle API
     def set_enabled(self, value: bool) -> None:
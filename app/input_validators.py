@@ -2,7 +2,11 @@ from __future__ import annotations
 from .exceptions import ValidationError
 from .calculator_config import load_config
 
-def parse_two_numbers(tokens: list[str]) -> tuple[float, float]:
+def parse_two_numbers(tokens: list[str], max_value: float | None = None) -> tuple[float, float]:
+    """
+    Parse exactly two numeric operands. max_value defaults to the configured
+    CALCULATOR_MAX_INPUT_VALUE; callers that already hold a Config can pass it.
+    """
     if len(tokens) != 2:
         raise ValidationError("Exactly two operands required.")
     try:
@@ -10,8 +14,8 @@ def parse_two_numbers(tokens: list[str]) -> tuple[float, float]:
     except ValueError as e:
         raise ValidationError("Operands must be numeric.") from e
 
-    cfg = load_config()
-    for v in (a, b):
-        if abs(v) > cfg.max_input_value:
-            raise ValidationError("Operand exceeds maximum allowed value.")
+    if max_value is None:
+        max_value = load_config().max_input_value
+    if abs(a) > max_value or abs(b) > max_value:
+        raise ValidationError("Operand exceeds maximum allowed value.")
     return a, b
\ No newline at end of file
@@ -1,7 +1,13 @@
 import logging
+from typing import Optional, Tuple
 from .calculator_config import load_config
 import os
 
+# (log file, level) the "calculator" logger is currently wired for
+_wired: Optional[Tuple[str, int]] = None
+# FileHandler installed for _wired; the fast path is only taken while it is still attached
+_handler: Optional[logging.FileHandler] = None
+
 def _level_from_env(default: str = "INFO") -> int:
     level = os.getenv("CALCULATOR_LOG_LEVEL", default).upper()
     return {
@@ -18,18 +24,22 @@ def get_logger() -> logging.Logger:
     If handlers point to a different file from a prior run, rewire them.
     Respects CALCULATOR_LOG_LEVEL (default INFO).
     """
+    global _wired, _handler
     cfg = load_config()
     logger = logging.getLogger("calculator")
-    logger.setLevel(_level_from_env())
-
+    level = _level_from_env()
     desired_path = cfg.log_file
-    need_file_handler = True
+    if _wired == (desired_path, level) and _handler in logger.handlers:
+        return logger
+    logger.setLevel(level)
+
+    file_handler: Optional[logging.FileHandler] = None
 
     # Remove file handlers pointing elsewhere
     for h in list(logger.handlers):
         if isinstance(h, logging.FileHandler):
             if getattr(h, "baseFilename", None) == desired_path:
-                need_file_handler = False
+                file_handler = h
             else:
                 logger.removeHandler(h)
                 try:
@@ -37,10 +47,12 @@ def get_logger() -> logging.Logger:
                 except Exception:
                     pass
 
-    if need_file_handler:
-        fh = logging.FileHandler(desired_path, encoding=cfg.default_encoding)
+    if file_handler is None:
+        file_handler = logging.FileHandler(desired_path, encoding=cfg.default_encoding)
         fmt = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-        fh.setFormatter(fmt)
-        logger.addHandler(fh)
+        file_handler.setFormatter(fmt)
+        logger.addHandler(file_handler)
 
+    _wired = (desired_path, level)
+    _handler = file_handler
     return logger
\ No newline at end of file
@@ -1,114 +1,87 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Protocol
+import math
+import operator
+from typing import Callable, Dict
 from .exceptions import OperationError
 
-class BinaryOperation(Protocol):
-    def execute(self, a: float, b: float) -> float: ...  # pragma: no cover
+# An operation is a plain callable (a, b) -> result
+BinaryOperation = Callable[[float, float], float]
 
+_cbrt = getattr(math, "cbrt", None)  # Python 3.11+
 
-@dataclass
-class Add:
-    def execute(self, a: float, b: float) -> float:
-        return a + b
 
+def _divide(a: float, b: float) -> float:
+    if b == 0:
+        raise OperationError("Division by zero.")
+    return a / b
 
-@dataclass
-class Subtract:
-    def execute(self, a: float, b: float) -> float:
-        return a - b
 
+def _root(a: float, b: float) -> float:
+    # Fast paths: square root of a non-negative base, cube root of any base
+    if b == 2.0 and a >= 0:
+        return math.sqrt(a)
+    if b == 3.0 and _cbrt is not None:
+        return _cbrt(a)
 
-@dataclass
-class Multiply:
-    def execute(self, a: float, b: float) -> float:
-        return a * b
+    if b == 0:
+        raise OperationError("Zeroth root undefined.")
 
+    # Negative base handling: only allowed for odd *integer* indices.
+    if a < 0:
+        # b must be an integer (within float representation)
+        if float(b).is_integer():
+            n = int(b)
+            if n % 2 == 0:
+                raise OperationError("Even root of negative number is not real.")
+            # odd integer root of a negative number is negative real:
+            return - (abs(a) ** (1.0 / n))
+        else:
+            raise OperationError("Root of negative base requires an integer index.")
 
-@dataclass
-class Divide:
-    def execute(self, a: float, b: float) -> float:
-        if b == 0:
-            raise OperationError("Division by zero.")
-        return a / b
+    # Non-negative base: standard real root
+    return a ** (1.0 / b)
 
 
-@dataclass
-class Power:
-    def execute(self, a: float, b: float) -> float:
-        return a ** b
+def _modulus(a: float, b: float) -> float:
+    if b == 0:
+        raise OperationError("Modulus by zero.")
+    return a % b
 
 
-@dataclass
-class Root:
-    def execute(self, a: float, b: float) -> float:
-        if b == 0:
-            raise OperationError("Zeroth root undefined.")
+def _int_divide(a: float, b: float) -> float:
+    if b == 0:
+        raise OperationError("Integer division by zero.")
+    return a // b
 
-        # Negative base handling: only allowed for odd *integer* indices.
-        if a < 0:
-            # b must be an integer (within float representation)
-            if float(b).is_integer():
-                n = int(b)
-                if n % 2 == 0:
-                    raise OperationError("Even root of negative number is not real.")
-                # odd integer root of a negative number is negative real:
-                return - (abs(a) ** (1.0 / n))
-            else:
-                raise OperationError("Root of negative base requires an integer index.")
 
-        # Non-negative base: standard real root
-        return a ** (1.0 / b)
+def _percent(a: float, b: float) -> float:
+    if b == 0:
+        raise OperationError("Percentage with denominator zero.")
+    return (a / b) * 100.0
 
 
-@dataclass
-class Modulus:
-    def execute(self, a: float, b: float) -> float:
-        if b == 0:
-            raise OperationError("Modulus by zero.")
-        return a % b
-
-
-@dataclass
-class IntDivide:
-    def execute(self, a: float, b: float) -> float:
-        if b == 0:
-            raise OperationError("Integer division by zero.")
-        return a // b
-
-
-@dataclass
-class Percent:
-    def execute(self, a: float, b: float) -> float:
-        if b == 0:
-            raise OperationError("Percentage with denominator zero.")
-        return (a / b) * 100.0
-
-
-@dataclass
-class AbsDiff:
-    def execute(self, a: float, b: float) -> float:
-        return abs(a - b)
+def _abs_diff(a: float, b: float) -> float:
+    return abs(a - b)
 
 
 class OperationFactory:
-    mapping = {
-        "add": Add,
-        "subtract": Subtract,
-        "multiply": Multiply,
-        "divide": Divide,
-        "power": Power,
-        "root": Root,
-        "modulus": Modulus,
-        "int_divide": IntDivide,
-        "percent": Percent,
-        "abs_diff": AbsDiff,
+    mapping: Dict[str, BinaryOperation] = {
+        "add": operator.add,
+        "subtract": operator.sub,
+        "multiply": operator.mul,
+        "divide": _divide,
+        "power": operator.pow,
+        "root": _root,
+        "modulus": _modulus,
+        "int_divide": _int_divide,
+        "percent": _percent,
+        "abs_diff": _abs_diff,
     }
 
     @classmethod
     def create(cls, name: str) -> BinaryOperation:
         key = name.strip().lower()
         try:
-            return cls.mapping[key]()
+            return cls.mapping[key]
         except KeyError as e:
-            raise OperationError(f"Unknown operation: {name}") from e
\ No newline at end of file
+            raise OperationError(f"Unknown operation: {name}") from e
@@ -7,4 +7,15 @@ def test_calc_model():
     assert d["a"] == 2
     assert d["b"] == 3
     assert d["result"] == 5
-    assert "timestamp" in d
\ No newline at end of file
+    assert "timestamp" in d
+
+def test_calc_timestamp_is_utc_iso():
+    from datetime import datetime, timezone
+    c = Calculation.from_values("add", 1, 1, 2)
+    ts = datetime.fromisoformat(c.timestamp)
+    assert ts.tzinfo is not None and ts.utcoffset() == timezone.utc.utcoffset(None)
+
+
+def test_calc_to_row_matches_dict_order():
+    c = Calculation.from_values("subtract", 5, 2, 3)
+    assert c.to_row() == tuple(c.to_dict().values())
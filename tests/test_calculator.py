@@ -38,4 +38,61 @@ def test_save_load(tmp_path, monkeypatch):
     assert len(c.cmd_history()) == 0
     n = c.cmd_load()
     assert n == 1
-    assert len(c.cmd_history()) == 1
\ No newline at end of file
+    assert len(c.cmd_history()) == 1
+
+def test_add_observer_is_notified(tmp_path, monkeypatch):
+    monkeypatch.setenv("CALCULATOR_HISTORY_DIR", str(tmp_path))
+    monkeypatch.setenv("CALCULATOR_LOG_DIR", str(tmp_path))
+    monkeypatch.setenv("CALCULATOR_AUTO_SAVE", "false")
+
+    seen = []
+
+    class Recorder:
+        def update(self, calc, history):
+            seen.append(calc.result)
+
+    c = Calculator()
+    c.add_observer(Recorder())
+    c.calculate("add", 1, 2)
+    assert seen == [3]
+
+def test_undo_redo_restores_evicted_and_cleared(tmp_path, monkeypatch):
+    monkeypatch.setenv("CALCULATOR_HISTORY_DIR", str(tmp_path))
+    monkeypatch.setenv("CALCULATOR_LOG_DIR", str(tmp_path))
+    monkeypatch.setenv("CALCULATOR_AUTO_SAVE", "false")
+    monkeypatch.setenv("CALCULATOR_MAX_HISTORY_SIZE", "2")
+
+    c = Calculator()
+    for n in (1, 2, 3):
+        c.calculate("add", n, 0)
+    assert [x.a for x in c.cmd_history()] == [2, 3]
+
+    c.cmd_undo()  # drops 3 and brings back the evicted 1
+    assert [x.a for x in c.cmd_history()] == [1, 2]
+    c.cmd_redo()
+    assert [x.a for x in c.cmd_history()] == [2, 3]
+
+    c.cmd_clear()
+    c.cmd_undo()
+    assert [x.a for x in c.cmd_history()] == [2, 3]
+    c.cmd_redo()
+    assert c.cmd_history() == []
+
+def test_zero_history_size_undo_redo(tmp_path, monkeypatch):
+    monkeypatch.setenv("CALCULATOR_HISTORY_DIR", str(tmp_path))
+    monkeypatch.setenv("CALCULATOR_LOG_DIR", str(tmp_path))
+    monkeypatch.setenv("CALCULATOR_AUTO_SAVE", "false")
+    monkeypatch.setenv("CALCULATOR_MAX_HISTORY_SIZE", "0")
+
+    c = Calculator()
+    assert c.calculate("add", 1, 2) == 3
+    c.cmd_undo()
+    c.cmd_redo()
+    assert c.cmd_history() == []
+
+def test_negative_history_size_rejected(tmp_path, monkeypatch):
+    monkeypatch.setenv("CALCULATOR_HISTORY_DIR", str(tmp_path))
+    monkeypatch.setenv("CALCULATOR_LOG_DIR", str(tmp_path))
+    monkeypatch.setenv("CALCULATOR_MAX_HISTORY_SIZE", "-1")
+    with pytest.raises(ValueError, match="CALCULATOR_MAX_HISTORY_SIZE"):
+        Calculator()
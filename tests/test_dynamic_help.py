@@ -27,4 +27,21 @@ def test_dynamic_help_lists_new_command(monkeypatch, tmp_path):
     assert "echo" in out and "aliases: say" in out
     # both canonical and alias should work
     assert "ECHO:hello world" in out
-    assert "ECHO:1 2 3" in out
\ No newline at end of file
+    assert "ECHO:1 2 3" in out
+
+def test_aliases_resolve_to_same_spec_listed_once():
+    assert resolve("say") is resolve("echo")
+    names = [s.name for s in all_specs()]
+    assert names.count("echo") == 1 and "say" not in names
+
+def test_command_registered_after_import_is_suggested(monkeypatch, tmp_path):
+    monkeypatch.setenv("CALCULATOR_HISTORY_DIR", str(tmp_path / "hist"))
+    monkeypatch.setenv("CALCULATOR_LOG_DIR", str(tmp_path / "logs"))
+    run_with_inputs(["ad 1 2", "exit"], monkeypatch)  # warm the suggestion cache first
+
+    @command("echo2", "echo back args (registered late)")
+    def _echo2(calc, args):
+        print("ECHO2:" + " ".join(args))
+
+    out = run_with_inputs(["echp2 hi", "exit"], monkeypatch)
+    assert "did you mean 'echo2'?" in out
@@ -61,4 +61,50 @@ def test_observers_logging_autosave(tmp_path, monkeypatch):
     assert os.path.exists(cfg.history_file)
     df = pd.read_csv(cfg.history_file)
     assert list(df.columns) == ["operation", "a", "b", "result", "timestamp"]
-    assert len(df) >= 1
\ No newline at end of file
+    assert len(df) >= 1
+
+def test_autosave_appends_then_resyncs(tmp_path, monkeypatch):
+    monkeypatch.setenv("CALCULATOR_HISTORY_DIR", str(tmp_path))
+    monkeypatch.setenv("CALCULATOR_LOG_DIR", str(tmp_path))
+    monkeypatch.setenv("CALCULATOR_AUTO_SAVE", "true")
+
+    from app.calculator import Calculator
+    calc = Calculator()
+    path = load_config().history_file
+    calc.calculate("add", 1, 1)
+    calc.calculate("add", 2, 2)
+    assert list(pd.read_csv(path)["a"]) == [1, 2]
+
+    # undo is not an append: the next autosave rewrites the whole file
+    calc.cmd_undo()
+    calc.calculate("add", 3, 3)
+    assert list(pd.read_csv(path)["a"]) == [1, 3]
+
+def test_logging_observer_skips_when_info_disabled(tmp_path, monkeypatch):
+    monkeypatch.setenv("CALCULATOR_HISTORY_DIR", str(tmp_path))
+    monkeypatch.setenv("CALCULATOR_LOG_DIR", str(tmp_path))
+    monkeypatch.setenv("CALCULATOR_LOG_LEVEL", "ERROR")
+
+    h = History(max_size=10)
+    c = Calculation.from_values("add", 1, 2, 3)
+    h.add(c)
+    observer = LoggingObserver()
+
+    sized = []
+    monkeypatch.setattr(History, "__len__", lambda self: sized.append(1) or 1)
+    monkeypatch.setattr(History, "items", lambda self: pytest.fail("items() evaluated"))
+    observer.update(c, h)
+    assert sized == []  # log arguments not built while INFO is disabled
+
+    monkeypatch.setenv("CALCULATOR_LOG_LEVEL", "INFO")
+    LoggingObserver().update(c, h)
+    assert sized == [1]
+
+def test_to_dataframe_columns(tmp_path, monkeypatch):
+    monkeypatch.setenv("CALCULATOR_HISTORY_DIR", str(tmp_path))
+    monkeypatch.setenv("CALCULATOR_LOG_DIR", str(tmp_path))
+    h = History(max_size=10)
+    assert list(h.to_dataframe().columns) == ["operation", "a", "b", "result", "timestamp"]
+    h.add(Calculation.from_values("multiply", 3, 4, 12))
+    df = h.to_dataframe()
+    assert df.loc[0, "operation"] == "multiply" and df.loc[0, "result"] == 12
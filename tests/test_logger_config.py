@@ -19,4 +19,51 @@ def test_logger_rebind_and_level(monkeypatch, tmp_path):
     # Confirm different handlers point to the new path by emitting and checking files exist
     path1 = os.path.join(str(tmp_path / "logs1"), "calculator.log")
     path2 = os.path.join(str(tmp_path / "logs2"), "calculator.log")
-    assert os.path.exists(path2)  # new handler created
\ No newline at end of file
+    assert os.path.exists(path2)  # new handler created
+
+def test_load_config_shared_per_environment(monkeypatch, tmp_path):
+    from app.calculator_config import load_config
+    monkeypatch.setenv("CALCULATOR_LOG_DIR", str(tmp_path / "logs"))
+    monkeypatch.setenv("CALCULATOR_HISTORY_DIR", str(tmp_path / "hist"))
+    assert load_config() is load_config()
+
+    monkeypatch.setenv("CALCULATOR_PRECISION", "3")
+    cfg = load_config()
+    assert cfg.precision == 3
+    assert os.path.isdir(cfg.log_dir) and os.path.isdir(cfg.history_dir)
+
+
+def test_logger_reuse_same_config(monkeypatch, tmp_path):
+    monkeypatch.setenv("CALCULATOR_LOG_DIR", str(tmp_path / "logs"))
+    monkeypatch.setenv("CALCULATOR_HISTORY_DIR", str(tmp_path / "hist"))
+    monkeypatch.setenv("CALCULATOR_LOG_LEVEL", "INFO")
+    log = get_logger()
+    handlers = list(log.handlers)
+
+    levels = []
+    real_set_level = log.setLevel
+    monkeypatch.setattr(log, "setLevel", lambda lvl: (levels.append(lvl), real_set_level(lvl)))
+    assert get_logger() is log
+    assert levels == []  # same file and level: no rewire
+    assert log.handlers == handlers
+
+    # changing only the level still rewires
+    monkeypatch.setenv("CALCULATOR_LOG_LEVEL", "WARNING")
+    get_logger()
+    assert levels == [logging.WARNING]
+    assert log.level == logging.WARNING
+
+
+def test_logger_readds_removed_file_handler(monkeypatch, tmp_path):
+    monkeypatch.setenv("CALCULATOR_LOG_DIR", str(tmp_path / "logs"))
+    monkeypatch.setenv("CALCULATOR_HISTORY_DIR", str(tmp_path / "hist"))
+    monkeypatch.setenv("CALCULATOR_LOG_LEVEL", "INFO")
+    log = get_logger()
+    for h in [h for h in log.handlers if isinstance(h, logging.FileHandler)]:
+        log.removeHandler(h)
+        h.close()
+
+    log = get_logger()
+    file_handlers = [h for h in log.handlers if isinstance(h, logging.FileHandler)]
+    assert len(file_handlers) == 1
+    assert file_handlers[0].baseFilename == os.path.join(str(tmp_path / "logs"), "calculator.log")
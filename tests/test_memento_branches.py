@@ -10,4 +10,26 @@ def test_memento_empty_undo_redo_errors():
     with pytest.raises(IndexError):
         ct.undo(snap)
     with pytest.raises(IndexError):
-        ct.redo(snap)
\ No newline at end of file
+        ct.redo(snap)
+
+def test_memento_depth_is_bounded():
+    ct = Caretaker(max_depth=2)
+    h = History(5)
+    for n in range(3):
+        h.add(Calculation.from_values("add", n, 0, n))
+        ct.save(h.to_snapshot())
+    ct.undo(h.to_snapshot())
+    ct.undo(h.to_snapshot())
+    assert not ct.can_undo()
+    assert ct.can_redo()
+
+def test_snapshot_shared_until_mutation():
+    h = History(5)
+    h.add(Calculation.from_values("add", 1, 1, 2))
+    s1 = h.to_snapshot()
+    assert h.to_snapshot().state is s1.state
+    h.add(Calculation.from_values("add", 2, 2, 4))
+    s2 = h.to_snapshot()
+    assert len(s1.state) == 1 and len(s2.state) == 2
+    h.restore(s1)
+    assert h.to_snapshot().state is s1.state
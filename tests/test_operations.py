@@ -14,29 +14,36 @@ from app.exceptions import OperationError
     ("abs_diff", 5, 11, 6),
 ])
 def test_basic_ops(op, a, b, exp):
-    result = OperationFactory.create(op).execute(a, b)
+    result = OperationFactory.create(op)(a, b)
     assert result == exp
 
 def test_divide_by_zero():
     with pytest.raises(OperationError):
-        OperationFactory.create("divide").execute(1, 0)
+        OperationFactory.create("divide")(1, 0)
 
 def test_mod_by_zero():
     with pytest.raises(OperationError):
-        OperationFactory.create("modulus").execute(1, 0)
+        OperationFactory.create("modulus")(1, 0)
 
 def test_int_divide_by_zero():
     with pytest.raises(OperationError):
-        OperationFactory.create("int_divide").execute(1, 0)
+        OperationFactory.create("int_divide")(1, 0)
 
 def test_root_even_negative():
     with pytest.raises(OperationError):
-        OperationFactory.create("root").execute(-8, 2)
+        OperationFactory.create("root")(-8, 2)
 
 def test_root_ok_odd():
-    result = OperationFactory.create("root").execute(-27, 3)
+    result = OperationFactory.create("root")(-27, 3)
     assert pytest.approx(result, rel=1e-9) == -3
 
 def test_unknown_operation():
     with pytest.raises(OperationError):
-        OperationFactory.create("unknown-op")
\ No newline at end of file
+        OperationFactory.create("unknown-op")
+
+def test_create_returns_shared_instance():
+    assert OperationFactory.create("add") is OperationFactory.create(" ADD ")
+
+@pytest.mark.parametrize("a,b,exp", [(9, 2, 3.0), (27, 3, 3.0), (-8, 3, -2.0), (16, 4, 2.0)])
+def test_root_values(a, b, exp):
+    assert OperationFactory.create("root")(a, b) == pytest.approx(exp, rel=1e-12)
@@ -1,3 +1,4 @@
+import math
 import os
 import pandas as pd
 import pytest
@@ -52,4 +53,99 @@ def test_atomic_save(tmp_path, monkeypatch):
     assert os.path.exists(out)
     # File should be readable (just empty or with header)
     df = pd.read_csv(out)
-    assert list(df.columns) == ["operation", "a", "b", "result", "timestamp"]
\ No newline at end of file
+    assert list(df.columns) == ["operation", "a", "b", "result", "timestamp"]
+
+def test_load_bom_and_reordered_columns(tmp_path, monkeypatch):
+    monkeypatch.setenv("CALCULATOR_HISTORY_DIR", str(tmp_path))
+    df = pd.DataFrame({
+        "timestamp": ["2025-01-01T00:00:00+00:00"],
+        "result": [3.0],
+        "operation": ["add"],
+        "a": [1.0],
+        "b": [2.0],
+    })
+    df.to_csv(tmp_path / "history.csv", index=False, encoding="utf-8-sig")
+    h = History(max_size=10)
+    assert h.load_csv() == 1
+    c = h.items()[0]
+    assert (c.operation, c.a, c.b, c.result) == ("add", 1.0, 2.0, 3.0)
+
+def test_load_pandas_written_nan(tmp_path, monkeypatch):
+    monkeypatch.setenv("CALCULATOR_HISTORY_DIR", str(tmp_path))
+    df = pd.DataFrame({
+        "operation": ["add", "subtract"],
+        "a": [float("nan"), 5.0],
+        "b": [1.0, 2.0],
+        "result": [float("nan"), 3.0],
+        "timestamp": ["2025-01-01T00:00:00+00:00", "2025-01-01T00:00:01+00:00"],
+    })
+    df.to_csv(tmp_path / "history.csv", index=False, encoding="utf-8")
+    h = History(max_size=10)
+    assert h.load_csv() == 2
+    first, second = h.items()
+    assert math.isnan(first.a) and math.isnan(first.result) and first.b == 1.0
+    assert (second.a, second.b, second.result) == (5.0, 2.0, 3.0)
+
+def test_load_keeps_newest_within_max_size(tmp_path, monkeypatch):
+    monkeypatch.setenv("CALCULATOR_HISTORY_DIR", str(tmp_path))
+    df = pd.DataFrame({
+        "operation": ["add"] * 3,
+        "a": [1.0, 2.0, 3.0],
+        "b": [0.0] * 3,
+        "result": [1.0, 2.0, 3.0],
+        "timestamp": ["2025-01-01T00:00:00+00:00"] * 3,
+    })
+    df.to_csv(tmp_path / "history.csv", index=False, encoding="utf-8")
+    h = History(max_size=2)
+    assert h.load_csv() == 2
+    assert [c.a for c in h.items()] == [2.0, 3.0]
+
+def test_refresh_config_picks_up_new_history_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("CALCULATOR_HISTORY_DIR", str(tmp_path / "a"))
+    h = History(max_size=10)
+    monkeypatch.setenv("CALCULATOR_HISTORY_DIR", str(tmp_path / "b"))
+    assert h.save_csv().startswith(str(tmp_path / "a"))
+    h.refresh_config()
+    assert h.save_csv().startswith(str(tmp_path / "b"))
+
+def test_save_skips_rewrite_when_unchanged(tmp_path, monkeypatch):
+    monkeypatch.setenv("CALCULATOR_HISTORY_DIR", str(tmp_path))
+    from app.calculation import Calculation
+    h = History(max_size=10)
+    h.add(Calculation.from_values("add", 1, 2, 3))
+    h.save_csv()
+
+    writes = []
+    monkeypatch.setattr(h, "_atomic_write", lambda *args: writes.append(args))
+    h.save_csv()
+    assert writes == []          # unchanged: no rewrite
+    h.clear()
+    h.save_csv()
+    assert len(writes) == 1      # changed: rewritten
+
+def _load_then_autosave(tmp_path, content):
+    from app.calculation import Calculation
+    path = tmp_path / "history.csv"
+    path.write_text(content, encoding="utf-8")
+    h = History(max_size=10)
+    h.load_csv()
+    calc = Calculation.from_values("multiply", 4, 5, 20)
+    h.add(calc)
+    h.append_csv_row(calc)
+    reloaded = History(max_size=10)
+    assert reloaded.load_csv() == 2
+    return reloaded.items()
+
+def test_autosave_after_loading_reordered_header(tmp_path, monkeypatch):
+    monkeypatch.setenv("CALCULATOR_HISTORY_DIR", str(tmp_path))
+    items = _load_then_autosave(
+        tmp_path, "timestamp,result,operation,a,b\n2025-01-01T00:00:00+00:00,3.0,add,1.0,2.0\n"
+    )
+    assert [(c.operation, c.result) for c in items] == [("add", 3.0), ("multiply", 20)]
+
+def test_autosave_after_loading_file_without_trailing_newline(tmp_path, monkeypatch):
+    monkeypatch.setenv("CALCULATOR_HISTORY_DIR", str(tmp_path))
+    items = _load_then_autosave(
+        tmp_path, "operation,a,b,result,timestamp\nadd,1.0,2.0,3.0,2025-01-01T00:00:00+00:00"
+    )
+    assert [(c.operation, c.result) for c in items] == [("add", 3.0), ("multiply", 20)]
@@ -12,4 +12,15 @@ def test_precision_runtime_change(monkeypatch, tmp_path):
     c.cmd_set_precision(2)
     r2 = c.calculate("divide", 1, 3)
     assert r1 != r2           # rounding should differ
-    assert r2 == 0.33         # 1/3 rounded to 2 decimals
\ No newline at end of file
+    assert r2 == 0.33         # 1/3 rounded to 2 decimals
+
+def test_precision_rounding_large_and_nonfinite(monkeypatch, tmp_path):
+    monkeypatch.setenv("CALCULATOR_HISTORY_DIR", str(tmp_path / "hist"))
+    monkeypatch.setenv("CALCULATOR_LOG_DIR", str(tmp_path / "logs"))
+    monkeypatch.setenv("CALCULATOR_AUTO_SAVE", "false")
+
+    c = Calculator()
+    c.cmd_set_precision(18)
+    assert c.calculate("power", 10.0, 300.0) == 1e300   # scaled value overflows
+    c.cmd_set_precision(0)
+    assert c.calculate("divide", 7.0, 2.0) == 4.0
@@ -44,4 +44,16 @@ def test_boundary_values(monkeypatch):
     # exactly at the limit should be OK
     monkeypatch.setenv("CALCULATOR_MAX_INPUT_VALUE", "42")
     a, b = parse_two_numbers(["42", "-42"])
-    assert a == 42.0 and b == -42.0
\ No newline at end of file
+    assert a == 42.0 and b == -42.0
+
+def test_explicit_max_value_overrides_config(monkeypatch):
+    monkeypatch.setenv("CALCULATOR_MAX_INPUT_VALUE", "1000")
+    assert parse_two_numbers(["5000", "1"], max_value=1e6) == (5000.0, 1.0)
+    with pytest.raises(ValidationError):
+        parse_two_numbers(["11", "1"], max_value=10)
+
+
+@pytest.mark.parametrize("a,b", [("nan", "1e13"), ("nan", "inf"), ("1e13", "nan")])
+def test_nan_operand_does_not_hide_other_over_limit(a, b):
+    with pytest.raises(ValidationError):
+        parse_two_numbers([a, b], max_value=1e12)